@@ -14,6 +14,8 @@ Supported slide types:
 The generator injects a JSON list into __SLIDES__ at build time.
 """
 
+from functools import lru_cache
+
 from manim import *
 import numpy as np
 import re
@@ -22,15 +24,26 @@ import re
 SAFE_MARGIN = 0.6
 
 
-def safe_rect(scene, margin=SAFE_MARGIN):
+def safe_frame(margin=SAFE_MARGIN):
+    """(width, height) of the centered safe area, without building a Rectangle."""
     # Use config frame size for CE 0.18 compatibility
-    w = config.frame_width - 2 * margin
-    h = config.frame_height - 2 * margin
-    r = Rectangle(width=max(0.1, w), height=max(0.1, h)).set_stroke(width=0).set_opacity(0)
+    return max(0.1, config.frame_width - 2 * margin), max(0.1, config.frame_height - 2 * margin)
+
+
+def safe_rect(scene, margin=SAFE_MARGIN):
+    w, h = safe_frame(margin)
+    r = Rectangle(width=w, height=h).set_stroke(width=0).set_opacity(0)
     r.move_to(ORIGIN)
     return r
 
 
+@lru_cache(maxsize=4096)
+def _text_width(s, font_size):
+    # Text() shapes through Pango; the fit searches below re-measure the same
+    # candidate lines at the same sizes many times per slide.
+    return Text(s, font_size=font_size).width
+
+
 def autowrap_to_width(text, max_w, font_size=36, line_buff=0.18, align=LEFT):
     words = (text or "").split()
     if not words:
@@ -38,7 +51,7 @@ def autowrap_to_width(text, max_w, font_size=36, line_buff=0.18, align=LEFT):
     lines, cur = [], ""
     for w in words:
         cand = (cur + " " + w).strip()
-        if Text(cand, font_size=font_size).width <= max_w or not cur:
+        if _text_width(cand, font_size) <= max_w or not cur:
             cur = cand
         else:
             lines.append(cur)
@@ -69,34 +82,40 @@ def center_in(group: Mobject, region: Mobject):
     return group
 
 
+def _xy_bounds(m: Mobject):
+    """(left, right, bottom, top) of m from one min/max pass over its points."""
+    pts = m.get_points_defining_boundary()
+    if len(pts) == 0:
+        return 0.0, 0.0, 0.0, 0.0
+    lo = pts.min(axis=0)
+    hi = pts.max(axis=0)
+    return lo[0], hi[0], lo[1], hi[1]
+
+
 def clamp_inside_scene(scene: Scene, m: Mobject, pad: float = 0.02) -> None:
     """Ensure m is fully inside the safe area by scaling (if needed) and shifting.
 
     This is a last-resort guard against any residual drift from animations or rounding.
     """
-    safe = safe_rect(scene)
+    safe_w, safe_h = safe_frame()
     # Scale to not exceed safe rect
-    max_w = max(0.1, safe.width - 2 * pad)
-    max_h = max(0.1, safe.height - 2 * pad)
+    max_w = max(0.1, safe_w - 2 * pad)
+    max_h = max(0.1, safe_h - 2 * pad)
     if m.width > max_w or m.height > max_h:
         m.scale(min(max_w / max(m.width, 1e-6), max_h / max(m.height, 1e-6)))
-    # Shift into bounds
-    left_bound = safe.get_left()[0] + pad
-    right_bound = safe.get_right()[0] - pad
-    bottom_bound = safe.get_bottom()[1] + pad
-    top_bound = safe.get_top()[1] - pad
+    # Shift into bounds (the safe rect is centered on ORIGIN)
+    left_bound = -safe_w / 2 + pad
+    right_bound = safe_w / 2 - pad
+    bottom_bound = -safe_h / 2 + pad
+    top_bound = safe_h / 2 - pad
     dx = 0.0
     dy = 0.0
-    left = m.get_left()[0]
-    right = m.get_right()[0]
-    bottom = m.get_bottom()[1]
-    top = m.get_top()[1]
+    left, right, bottom, top = _xy_bounds(m)
     if left < left_bound and right <= right_bound:
         dx = left_bound - left
     elif right > right_bound and left >= left_bound:
         dx = right_bound - right
-    # If both out, width > safe; we already scaled, so recompute and clamp center
-    left = m.get_left()[0]; right = m.get_right()[0]
+    # If both out, width > safe; we already scaled, so clamp center
     if left < left_bound:
         dx = max(dx, left_bound - left)
     if right > right_bound:
@@ -105,7 +124,6 @@ def clamp_inside_scene(scene: Scene, m: Mobject, pad: float = 0.02) -> None:
         dy = bottom_bound - bottom
     elif top > top_bound and bottom >= bottom_bound:
         dy = top_bound - top
-    bottom = m.get_bottom()[1]; top = m.get_top()[1]
     if bottom < bottom_bound:
         dy = max(dy, bottom_bound - bottom)
     if top > top_bound:
@@ -116,10 +134,18 @@ def clamp_inside_scene(scene: Scene, m: Mobject, pad: float = 0.02) -> None:
 
 def make_panel(scene, tl, br, rows=12, cols=12):
     # tl, br in grid coords (0..rows-1, 0..cols-1), inclusive
-    root = safe_rect(scene)
-    cw = root.width / cols
-    ch = root.height / rows
-    top_left = root.get_corner(UL)
+    w, h = safe_frame()
+    return _panel_rect(tuple(tl), tuple(br), rows, cols, w, h)
+
+
+@lru_cache(maxsize=None)
+def _panel_rect(tl, br, rows, cols, w, h):
+    # Every slide asks for the same handful of panels. Panels are only
+    # measured, never added to the scene or moved, so one invisible
+    # Rectangle per (cell span, grid, safe-frame size) is shared.
+    cw = w / cols
+    ch = h / rows
+    top_left = (-w / 2, h / 2)
     left = top_left[0] + (tl[1]) * cw
     right = top_left[0] + (br[1] + 1) * cw
     top = top_left[1] - (tl[0]) * ch
@@ -182,12 +208,12 @@ def build_bullets(scene, title, items, min_font=30):
     else:
         pages.append(items)
 
+    # The fit loop already built every row at the final font size; reuse them.
+    rows = list(cur.submobjects)
+    start = 0
     for idx, page in enumerate(pages):
-        g = VGroup()
-        for it in page:
-            para = autowrap_to_width(it, max_w=b_reg.width * 0.92, font_size=f, align=LEFT)
-            row = VGroup(Text("•", font_size=f), para).arrange(RIGHT, buff=0.35, aligned_edge=UP)
-            g.add(row)
+        g = VGroup(*rows[start:start + len(page)])
+        start += len(page)
         g.arrange(DOWN, buff=0.32, aligned_edge=LEFT)
         scale_to_fit(g, b_reg, pad=0.05)
         g.move_to(b_reg.get_left() + RIGHT * 0.1)
@@ -239,7 +265,25 @@ def build_equation(scene, title, latex_lines):
         scene.wait(0.3)
 
 
-def build_plot(scene, title, expr, x_range=(-5, 5, 1), y_range=(-3, 3, 1)):
+# Axis ranges used when a plot slide omits them
+DEFAULT_X_RANGE = (-5, 5, 1)
+DEFAULT_Y_RANGE = (-3, 3, 1)
+
+# Names visible to plot expressions; built once, copied per plot.
+_PLOT_NAMESPACE = {k: getattr(np, k) for k in [
+    "sin", "cos", "tan", "exp", "log", "sqrt", "abs", "arctan", "arcsin", "arccos"
+]}
+# Support constants, symbols, and numpy namespace
+_PLOT_NAMESPACE.update({
+    "pi": np.pi, "e": np.e, "np": np,
+    # default physical constants/symbols used in expressions
+    "g": 9.8,  # gravity magnitude
+    "a": 1.0,  # default acceleration
+    "v0": 0.0, "k": 1.0, "b": 1.0, "m": 1.0, "c": 1.0
+})
+
+
+def build_plot(scene, title, expr, x_range=DEFAULT_X_RANGE, y_range=DEFAULT_Y_RANGE):
     t_reg = make_panel(scene, (1, 0), (2, 11))
     p_reg = make_panel(scene, (3, 0), (11, 11))
     t = autowrap_to_width(title, max_w=t_reg.width * 0.98, font_size=46)
@@ -252,18 +296,6 @@ def build_plot(scene, title, expr, x_range=(-5, 5, 1), y_range=(-3, 3, 1)):
     center_in(axes, p_reg)
     scene.play(Create(axes))
     clamp_inside_scene(scene, axes)
-    allowed = {k: getattr(np, k) for k in [
-        "sin", "cos", "tan", "exp", "log", "sqrt", "abs", "arctan", "arcsin", "arccos"
-    ]}
-    # Support constants, symbols, and numpy namespace
-    allowed.update({
-        "pi": np.pi, "e": np.e, "np": np,
-        # default physical constants/symbols used in expressions
-        "g": 9.8,  # gravity magnitude
-        "a": 1.0,  # default acceleration
-        "v0": 0.0, "k": 1.0, "b": 1.0, "m": 1.0, "c": 1.0
-    })
-
     def normalize_expr(s: str) -> str:
         s = str(s or "").strip()
         # Take RHS of assignment if present
@@ -278,13 +310,29 @@ def build_plot(scene, title, expr, x_range=(-5, 5, 1), y_range=(-3, 3, 1)):
         return s
 
     expr = normalize_expr(expr)
+    env = {"__builtins__": {}}
+    scope = dict(_PLOT_NAMESPACE)
+    # Parse once; eval of a code object skips re-compiling at every sample.
+    try:
+        code = compile(expr, "<plot expr>", "eval")
+    except (SyntaxError, ValueError):
+        code = compile("np.sin(x)", "<plot expr>", "eval")
+
     def f(x):
+        scope["x"] = x
         try:
-            return eval(expr, {"__builtins__": {}}, dict(allowed, x=x))
-        except Exception:
-            # Fallback to a simple sine if expression is invalid
+            return eval(code, env, scope)
+        except (ArithmeticError, TypeError, ValueError):
+            # Fallback to a simple sine where the expression is undefined
             return np.sin(x)
-    graph = axes.plot(lambda x: f(x), x_range=(x_range[0], x_range[1]))
+
+    # An expression with unknown names or attributes fails at every sample;
+    # find out once and plot the fallback without per-sample raises.
+    try:
+        f(x_range[0])
+    except Exception:
+        f = np.sin
+    graph = axes.plot(f, x_range=(x_range[0], x_range[1]))
     grp = VGroup(axes, graph)
     scene.play(Create(graph))
     clamp_inside_scene(scene, grp)
@@ -332,6 +380,54 @@ def build_figure(scene, title, caption=""):
     scene.wait(0.6)
 
 
+# ---------- slide dispatch ----------
+def _bullets_slide(scene, s):
+    build_bullets(scene, s.get("title", ""), s.get("items", []))
+
+
+def _two_column_slide(scene, s):
+    build_two_col(
+        scene,
+        s.get("left_title", ""),
+        s.get("left", ""),
+        s.get("right_title", ""),
+        s.get("right", ""),
+    )
+
+
+def _equation_slide(scene, s):
+    build_equation(scene, s.get("title", "Derivation"), s.get("lines", []))
+
+
+def _plot_slide(scene, s):
+    build_plot(
+        scene,
+        s.get("title", "Plot"),
+        s.get("expr", "np.sin(x)"),
+        tuple(s.get("x_range", DEFAULT_X_RANGE)),
+        tuple(s.get("y_range", DEFAULT_Y_RANGE)),
+    )
+
+
+def _bar_slide(scene, s):
+    build_bar(scene, s.get("title", "Chart"), s.get("labels", []), s.get("values", []))
+
+
+def _figure_slide(scene, s):
+    build_figure(scene, s.get("title", "Figure"), s.get("caption", ""))
+
+
+# Slide type -> builder; one dict lookup per slide instead of an elif chain
+SLIDE_BUILDERS = {
+    "bullets": _bullets_slide,
+    "two_column": _two_column_slide,
+    "equation": _equation_slide,
+    "plot": _plot_slide,
+    "bar": _bar_slide,
+    "figure": _figure_slide,
+}
+
+
 # ---------- SCENE ----------
 class Lesson(Scene):
     def construct(self):
@@ -345,35 +441,11 @@ class Lesson(Scene):
 
         # Content slides
         for s in slides:
-            t = s.get("type")
-            if t == "bullets":
-                build_bullets(self, s.get("title", ""), s.get("items", []))
-            elif t == "two_column":
-                build_two_col(
-                    self,
-                    s.get("left_title", ""),
-                    s.get("left", ""),
-                    s.get("right_title", ""),
-                    s.get("right", ""),
-                )
-            elif t == "equation":
-                build_equation(self, s.get("title", "Derivation"), s.get("lines", []))
-            elif t == "plot":
-                build_plot(
-                    self,
-                    s.get("title", "Plot"),
-                    s.get("expr", "np.sin(x)"),
-                    tuple(s.get("x_range", [-5, 5, 1])),
-                    tuple(s.get("y_range", [-3, 3, 1])),
-                )
-            elif t == "bar":
-                build_bar(self, s.get("title", "Chart"), s.get("labels", []), s.get("values", []))
-            elif t == "figure":
-                build_figure(self, s.get("title", "Figure"), s.get("caption", ""))
-            else:
-                # fallback bullet slide
-                build_bullets(self, s.get("title", ""), s.get("items", []))
+            # Unknown types fall back to a bullet slide
+            SLIDE_BUILDERS.get(s.get("type"), _bullets_slide)(self, s)
             self.wait(0.4)
-            # clear for next slide
-            self.play(*[FadeOut(m) for m in list(self.mobjects)])
+            # clear for next slide: one FadeOut over a Group instead of one
+            # animation per mobject (and play() with none would raise)
+            if self.mobjects:
+                self.play(FadeOut(Group(*self.mobjects)))
             self.wait(0.2)
@@ -6,7 +6,8 @@ ensuring nothing goes off-frame and no overlaps occur.
 """
 
 from manim import *
-from .layout import safe_rect, fit_and_place, autowrap_text
+import numpy as np
+from .layout import safe_rect, fit_and_place, autowrap_text, autowrap_text_batch
 
 
 class PanelGrid:
@@ -17,42 +18,41 @@ class PanelGrid:
         self.root = safe_rect(scene, margin=margin)
         self.rows, self.cols = rows, cols
         self.vpad, self.hpad = vpad, hpad
-        self._cells = self._build_cells()
+        self._build_cells()
+        # Regions are only measured by components, so each span is built once
+        self._regions = {}
 
     def _build_cells(self):
-        cells = []
         W = self.root.width
         H = self.root.height
-        cw = W / self.cols
-        ch = H / self.rows
+        self._cw = W / self.cols
+        self._ch = H / self.rows
         top_left = self.root.get_corner(UL)
-        for r in range(self.rows):
-            row = []
-            for c in range(self.cols):
-                x = top_left[0] + (c + 0.5) * cw
-                y = top_left[1] - (r + 0.5) * ch
-                cell = (
-                    Rectangle(width=cw - self.hpad, height=ch - self.vpad)
-                    .set_opacity(0)
-                    .set_stroke(width=0)
-                )
-                cell.move_to([x, y, 0])
-                row.append(cell)
-            cells.append(row)
-        return cells
+        # Cells are never drawn, only measured: keep their centers, not Mobjects
+        self._cx = top_left[0] + (np.arange(self.cols) + 0.5) * self._cw
+        self._cy = top_left[1] - (np.arange(self.rows) + 0.5) * self._ch
 
     def region(self, r0: int, c0: int, r1: int, c1: int) -> Mobject:
         """Inclusive cell indices. (r0,c0) top-left; (r1,c1) bottom-right."""
-        group = VGroup()
-        for r in range(r0, r1 + 1):
-            for c in range(c0, c1 + 1):
-                group.add(self._cells[r][c])
+        key = (r0, c0, r1, c1)
+        cached = self._regions.get(key)
+        if cached is not None:
+            return cached
+        # Bounding box of the padded cells: outer pads are excluded, inner gaps kept
+        width = (c1 - c0 + 1) * self._cw - self.hpad
+        height = (r1 - r0 + 1) * self._ch - self.vpad
+        center = [
+            (self._cx[c0] + self._cx[c1]) / 2,
+            (self._cy[r0] + self._cy[r1]) / 2,
+            0,
+        ]
         rect = (
-            Rectangle(width=group.width, height=group.height)
-            .move_to(group.get_center())
+            Rectangle(width=width, height=height)
+            .move_to(center)
             .set_opacity(0)
             .set_stroke(width=0)
         )
+        self._regions[key] = rect
         return rect
 
 
@@ -108,14 +108,9 @@ class BulletList:
             reg = grid.region(row_start, grid.cols // 2, row_end, grid.cols - 1)
         else:
             reg = grid.region(row_start, 0, row_end, grid.cols - 1)
-        items = []
         max_w = reg.width * 0.95
-        for b in (bullets or [])[:10]:
-            text = str(b).strip()
-            if not text:
-                continue
-            line = autowrap_text(f"- {text}", max_w=max_w, font_size=font_size)
-            items.append(line)
+        texts = [str(b).strip() for b in (bullets or [])[:10]]
+        items = autowrap_text_batch([f"- {t}" for t in texts if t], max_w=max_w, font_size=font_size)
         if not items:
             g = VGroup()
         else:
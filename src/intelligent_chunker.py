@@ -6,14 +6,25 @@ chunk text from the original content with fuzzy matching and safe fallbacks.
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 import re
-import json
 import math
-from openai import OpenAI
 
+from .llm_json import extract_json_object
+from .openai_client import get_openai_client
 from .unified_book_processor import BookContent
 
+_ELLIPSIS_RE = re.compile(r'[.]{3,}')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=4)
+def _collapse_whitespace(text: str) -> str:
+    # Fuzzy marker lookups normalize the whole book for every chunk boundary;
+    # str caches its hash, so repeat lookups for the same text are O(1).
+    return ' '.join(text.split())
+
 
 @dataclass
 class ContentChunk:
@@ -48,7 +59,7 @@ class IntelligentChunker:
     )
 
     def __init__(self, openai_api_key: str, model: str = "gpt-4o-mini"):
-        self.client = OpenAI(api_key=openai_api_key)
+        self.client = get_openai_client(openai_api_key)
         self.model = model
         self.words_per_minute = 150
         self.content_expansion = 1.5
@@ -122,25 +133,23 @@ class IntelligentChunker:
 
     # Helpers
     def _prepare_content_for_analysis(self, content: str, max_chars: int = 12000) -> str:
-        if len(content) <= max_chars:
+        n = len(content)
+        if n <= max_chars:
             return content
-        truncated = content[:max_chars]
-        last_para = truncated.rfind("\n\n")
-        if last_para > max_chars * 0.8:
-            truncated = truncated[:last_para]
+        # Only boundaries in the tail of the window are accepted, so search just
+        # that range and slice the original once.
+        cut = max_chars
+        last_para = content.rfind("\n\n", int(max_chars * 0.8) + 1, max_chars)
+        if last_para != -1:
+            cut = last_para
         else:
-            last_sentence = truncated.rfind('.')
-            if last_sentence > max_chars * 0.9:
-                truncated = truncated[: last_sentence + 1]
-        return truncated + f"\n\n[CONTENT TRUNCATED - total {len(content)} chars]"
+            last_sentence = content.rfind('.', int(max_chars * 0.9) + 1, max_chars)
+            if last_sentence != -1:
+                cut = last_sentence + 1
+        return f"{content[:cut]}\n\n[CONTENT TRUNCATED - total {n} chars]"
 
     def _parse_json(self, text: str) -> Optional[Dict[str, Any]]:
-        m = re.search(r"```json\s*(.*?)```", text, re.DOTALL)
-        raw = m.group(1) if m else text[text.find('{') : text.rfind('}') + 1]
-        try:
-            return json.loads(raw)
-        except Exception:
-            return None
+        return extract_json_object(text)
 
     def _extract_chunk_content(self, full: str, start_marker: str, end_marker: str, target_words: int, idx: int, total: int) -> str:
         start_marker = (start_marker or '').strip()
@@ -176,7 +185,7 @@ class IntelligentChunker:
         if pos >= 0:
             return pos
         p_norm = ' '.join(self._clean_marker(pattern).split())
-        t_norm = ' '.join(text.split())
+        t_norm = _collapse_whitespace(text)
         pos = t_norm.find(p_norm, start_pos)
         return pos
 
@@ -214,8 +223,8 @@ class IntelligentChunker:
 
     def _clean_marker(self, s: str) -> str:
         s = s.replace('…', '...')
-        s = re.sub(r'[.]{3,}', ' ', s)
-        s = re.sub(r'\s+', ' ', s)
+        s = _ELLIPSIS_RE.sub(' ', s)
+        s = _WHITESPACE_RE.sub(' ', s)
         return s.strip()
 
     def _fallback_chunking(self, book_content: BookContent, target_duration: int) -> List[ContentChunk]:
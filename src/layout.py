@@ -5,6 +5,8 @@ Provides a safe drawing area, fitting helpers, and paragraph-style text
 wrapping using Manim measurements.
 """
 
+from functools import lru_cache
+
 from manim import *
 import numpy as np
 
@@ -26,14 +28,26 @@ def scale_to_fit(m: Mobject, max_w: float, max_h: float) -> None:
         m.scale_to_fit_height(max_h)
 
 
+def _xy_bounds(m: Mobject):
+    """(left, right, bottom, top) of m from one min/max pass over its points."""
+    pts = m.get_points_defining_boundary()
+    if len(pts) == 0:
+        return 0.0, 0.0, 0.0, 0.0
+    lo = pts.min(axis=0)
+    hi = pts.max(axis=0)
+    return lo[0], hi[0], lo[1], hi[1]
+
+
 def clamp_to(m: Mobject, rect: Mobject, pad: float = 0.0) -> None:
-    left = rect.get_left()[0] + pad
-    right = rect.get_right()[0] - pad
-    bottom = rect.get_bottom()[1] + pad
-    top = rect.get_top()[1] - pad
+    left, right, bottom, top = _xy_bounds(rect)
+    left += pad
+    right -= pad
+    bottom += pad
+    top -= pad
     cx, cy, _ = m.get_center()
-    cx = float(np.clip(cx, left, right))
-    cy = float(np.clip(cy, bottom, top))
+    # Scalar clip; same result as np.clip, including right winning when left > right
+    cx = float(min(max(cx, left), right))
+    cy = float(min(max(cy, bottom), top))
     m.move_to(np.array([cx, cy, 0.0]))
 
 
@@ -46,23 +60,61 @@ def fit_and_place(m: Mobject, region: Mobject, pad: float = 0.2) -> Mobject:
     return m
 
 
-def autowrap_text(txt: str, max_w: float, font_size: int = 36, line_buff: float = 0.18, align=LEFT) -> Mobject:
-    words = (txt or "").split()
-    if not words:
-        return Text("", font_size=font_size)
+@lru_cache(maxsize=4096)
+def _text_width(s: str, font_size: int) -> float:
+    """Rendered width of s; memoized because wrap attempts re-measure the same lines."""
+    return Text(s, font_size=font_size).width
+
+
+def _break_lines(words: list, max_w: float, font_size: int) -> list:
     lines, cur = [], ""
     for w in words:
         cand = (cur + " " + w).strip()
-        if not cur or Text(cand, font_size=font_size).width <= max_w:
+        if not cur or _text_width(cand, font_size) <= max_w:
             cur = cand
         else:
             lines.append(cur)
             cur = w
     if cur:
         lines.append(cur)
+    return lines
+
+
+def _lines_to_mobject(lines: list, font_size: int, line_buff: float, align) -> Mobject:
     if len(lines) <= 1:
         return Text(" ".join(lines), font_size=font_size)
-    vg = VGroup(*[Text(l, font_size=font_size) for l in lines]).arrange(
+    return VGroup(*[Text(l, font_size=font_size) for l in lines]).arrange(
         DOWN, aligned_edge=align, buff=line_buff
     )
-    return vg
+
+
+def autowrap_text(txt: str, max_w: float, font_size: int = 36, line_buff: float = 0.18, align=LEFT) -> Mobject:
+    words = (txt or "").split()
+    if not words:
+        return Text("", font_size=font_size)
+    return _lines_to_mobject(_break_lines(words, max_w, font_size), font_size, line_buff, align)
+
+
+def autowrap_text_batch(texts: list, max_w: float, font_size: int = 36, line_buff: float = 0.18, align=LEFT) -> list:
+    """autowrap_text for short items (bullets) sharing one width and font size."""
+    # One probe per batch: a generous estimate of how many characters fit on a
+    # line. Only items under it try the whole-line fast path; the rest (and
+    # any misestimate) take the exact word-by-word wrap.
+    char_w = _text_width("abcdefghijklmnopqrstuvwxyz", font_size) / 26
+    max_chars = int(1.25 * max_w / char_w) if char_w > 0 else 0
+    out = []
+    for txt in texts:
+        words = (txt or "").split()
+        if not words:
+            out.append(Text("", font_size=font_size))
+            continue
+        line = " ".join(words)
+        if len(words) == 1 or len(line) <= max_chars:
+            # Likely a one-liner: measure it once and keep that Text instead
+            # of probing word by word and rebuilding it
+            whole = Text(line, font_size=font_size)
+            if len(words) == 1 or whole.width <= max_w:
+                out.append(whole)
+                continue
+        out.append(_lines_to_mobject(_break_lines(words, max_w, font_size), font_size, line_buff, align))
+    return out
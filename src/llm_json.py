@@ -0,0 +1,30 @@
+"""
+JSON extraction from LLM replies.
+
+Shared by the pipeline stages that ask the model for a JSON object
+(chunk plans, teaching content).
+"""
+
+import json
+import re
+from typing import Any, Dict, Optional
+
+_JSON_FENCE_RE = re.compile(r"```json\s*(.*?)```", re.DOTALL)
+
+
+def extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """Parse the JSON object in an LLM reply (```json fenced or bare braces)."""
+    m = _JSON_FENCE_RE.search(text)
+    if m:
+        raw = m.group(1)
+    else:
+        start = text.find('{')
+        end = text.rfind('}')
+        if start == -1 or end < start:
+            # Prose-only reply (refusal, explanation): nothing to decode
+            return None
+        raw = text[start : end + 1]
+    try:
+        return json.loads(raw)
+    except Exception:
+        return None
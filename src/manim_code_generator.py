@@ -7,18 +7,89 @@ varied slides with plots/charts/figures). Auto-debug loop persists attempt
 code, diffs, and logs for reliable re-editing.
 """
 
+import ast
 import os
 import re
 import json
+import hashlib
 import subprocess
 import difflib
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any, List
-from openai import OpenAI
 
+from .openai_client import get_openai_client
 from .openai_video_generator import TeachingContent
 
+# Regexes used on every compile/fix attempt, compiled once.
+_SCENE_CLASS_RE = re.compile(r"class\s+(\w+)\s*\(Scene\)")
+_PLOT_EXPR_RE = re.compile(r"\"expr\"\s*:\s*\"([^\"]*)\"")
+_EQUATION_LINES_RE = re.compile(r'"lines"\s*:\s*\[(.*?)\]', re.DOTALL)
+_STRING_LITERAL_RE = re.compile(r'"([^"\\]*)"')
+_PI_RE = re.compile(r"\bpi\b")
+_T_VAR_RE = re.compile(r"\bt\b")
+_SUBSCRIPT_FIXES = tuple((re.compile(p), r) for p, r in (
+    (r'\bv0\b', r'v_0'),
+    (r'\bx0\b', r'x_0'),
+    (r'\bt0\b', r't_0'),
+))
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7F]')
+
+# manim's media/videos/<stem>/<dir> name for each -q flag.
+_QUALITY_DIRS = {'l': '480p15', 'm': '720p30', 'h': '1080p60', 'p': '1440p60', 'k': '2160p60'}
+
+# Topic keywords for the fallback deck's visual slide, one scan for all
+# groups; the fallback checks motion, then energy, then force.
+_TOPIC_VISUAL_RE = re.compile(
+    r"(?P<motion>velocity|acceleration|kinematic|motion)"
+    r"|(?P<energy>work|energy|power)"
+    r"|(?P<force>force|free-body|newton)"
+)
+
+# Common small fixes tried when the model cannot repair a failing scene
+_FALLBACK_FIXES = tuple((re.compile(p), r) for p, r in (
+    (r"Text\(([^\)]*)size\s*=\s*\d+([^\)]*)\)", r"Text(\1\2)"),
+    (r"(Write|Create)\(([^\)]*),\s*run_time\s*=\s*[^\)]*\)", r"\1(\2)"),
+    (r"\.to_edge\(([^\)]*),\s*buff\s*=\s*[^\)]*\)", r".to_edge(\1)"),
+    (r"ShowCreation\(", r"Create("),
+    (r"ReplacementTransform\(", r"Transform("),
+    # Replace external assets with simple placeholders
+    (r"SVGMobject\([^\)]*\)", r"Text('diagram', font_size=36)"),
+    (r"ImageMobject\([^\)]*\)", r"Text('image', font_size=36)"),
+    # Defensive: ensure Scene subclass exists
+    (r"class\s+(\w+)\s*\((?:MovingCamera)?Scene\)\s*:\s*pass", r"class \1(Scene):\n    def construct(self):\n        self.add(Text('Placeholder', font_size=36))"),
+))
+
+# Renderer templates ship next to this module.
+_TEMPLATE_DIR = Path(__file__).resolve().parent
+
+
+@lru_cache(maxsize=None)
+def _read_template(name: str) -> str:
+    """Return a renderer template's source; each file is read once per process."""
+    return (_TEMPLATE_DIR / name).read_text(encoding='utf-8')
+
+
+def _detect_scene_name(code: str) -> str:
+    m = _SCENE_CLASS_RE.search(code)
+    if m:
+        return m.group(1)
+    # Regex only sees the one-line "(Scene)" form; parse once for the rest
+    # (ThreeDScene/MovingCameraScene bases, manim.Scene, multi-line headers).
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return "Scene"
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for base in node.bases:
+            name = base.id if isinstance(base, ast.Name) else getattr(base, "attr", "")
+            if name.endswith("Scene"):
+                return node.name
+    return "Scene"
+
 
 @dataclass
 class VideoGenerationResult:
@@ -53,20 +124,88 @@ class ManimCodeGenerator:
         "ERROR/LOG:\n{error_log}\n\nCODE:\n{code}\n"
     )
 
+    # Prologue for LLM-written scenes: the manim import, and the same import
+    # with fixed seeds so reruns of a fix attempt render identically.
+    MANIM_IMPORT_HEADER = "from manim import *\n\n"
+    SEEDED_IMPORT_HEADER = "from manim import *\nimport random, numpy as np\nrandom.seed(42); np.random.seed(42)\n\n"
+
+    # Static schema for the blocks IR request; per-lesson fields are appended.
+    BLOCKS_IR_PROMPT_HEADER = (
+        "You are an educational storyboarder. Return ONLY JSON (no prose).\n"
+        "Schema: a JSON array of blocks. Block types:\n"
+        "  - {\"type\": \"title\", \"text\": str}\n"
+        "  - {\"type\": \"two_column\", \"left\": str, \"right\": str}\n"
+        "  - {\"type\": \"formula\", \"latex\": str, \"row_start\": int, \"row_end\": int}\n"
+        "Rules:\n- No coordinates, no .shift/.to_edge.\n- Keep text concise.\n- Prefer two_column with summary on left and key points or short formula on right.\n"
+    )
+
+    # Static schema for the slides IR request. Kept verbatim ahead of the
+    # per-lesson fields so the prompt prefix is identical across calls.
+    SLIDES_IR_PROMPT_HEADER = (
+        "Return ONLY JSON (no prose). Schema is a JSON array of slide dicts (no wrapper key).\n"
+        "Slide types: title/bullets/two_column/equation/plot/bar/figure.\n"
+        "Examples:\n"
+        "  {\"type\":\"title\",\"text\":str}\n"
+        "  {\"type\":\"bullets\",\"title\":str,\"items\":[str,...]}\n"
+        "  {\"type\":\"two_column\",\"left_title\":str,\"left\":str,\"right_title\":str,\"right\":str}\n"
+        "  {\"type\":\"equation\",\"title\":str,\"lines\":[latex,...]}\n"
+        "  {\"type\":\"plot\",\"title\":str,\"expr\":python_expr,\"x_range\":[min,max,step],\"y_range\":[min,max,step]}\n"
+        "  {\"type\":\"bar\",\"title\":str,\"labels\":[str],\"values\":[num]}\n"
+        "  {\"type\":\"figure\",\"title\":str,\"caption\":str}\n"
+        "Rules: keep text concise; no coordinates; ensure slides are varied and readable.\n"
+    )
+
+    # Scene file for the structured renderer path; __BLUEPRINT_JSON__ is
+    # replaced with the escaped blueprint JSON.
+    STRUCTURED_SCRIPT_TEMPLATE = """
+from manim import *
+import json
+import sys
+from pathlib import Path
+
+# Ensure repo root is importable for src.* modules
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.structured_renderer import render_video
+
+BLUEPRINT = json.loads('__BLUEPRINT_JSON__')
+
+class Video(Scene):
+    def construct(self):
+        render_video(self, BLUEPRINT)
+"""
+
     def __init__(self, openai_api_key: str, model: str = "gpt-4o", output_dir: str = "output/unified/videos", temp_dir: str = "temp/unified"):
-        self.client = OpenAI(api_key=openai_api_key)
+        self.client = get_openai_client(openai_api_key)
         self.model = model
-        self.output_dir = Path(output_dir); self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.temp_dir = Path(temp_dir); self.temp_dir.mkdir(parents=True, exist_ok=True)
+        self.output_dir = Path(output_dir)
+        self.temp_dir = Path(temp_dir)
+        # Attempt logs, code snapshots and fix diffs
+        self.reports_dir = self.output_dir.parent / 'reports'
+        self._ensure_dirs()
         self.max_debug_attempts = 5
         self.manim_quality = "l"  # 480p equivalent for speed
+        # Environment for manim subprocesses, built once: ensure src/ is
+        # importable by the generated script
+        self.compile_env = os.environ.copy()
+        repo_root = Path(__file__).resolve().parents[1]
+        self.compile_env['PYTHONPATH'] = (self.compile_env.get('PYTHONPATH', '') + (os.pathsep if self.compile_env.get('PYTHONPATH') else '') + str(repo_root))
         # New default: slides IR renderer
         self.use_slides_renderer = True
         # Optional alternates
         self.use_blocks_renderer = False
         self.use_structured_renderer = False
 
+    def _ensure_dirs(self) -> None:
+        """(Re)create work dirs; temp/ and output/ may be deleted between runs."""
+        for d in (self.output_dir, self.temp_dir, self.reports_dir):
+            d.mkdir(parents=True, exist_ok=True)
+
     def generate_video(self, teaching_content: TeachingContent, audience: str = "undergraduate", output_name: Optional[str] = None) -> Optional[str]:
+        # The generator is reused across interactive runs
+        self._ensure_dirs()
         if not output_name:
             safe = re.sub(r"[^\w\s-]", "", teaching_content.title)
             safe = re.sub(r"[-\s]+", "_", safe)
@@ -117,13 +256,7 @@ class ManimCodeGenerator:
     # ----------------------
     def _generate_blocks_ir(self, tc: TeachingContent, audience: str) -> List[Dict[str, Any]]:
         """Ask the model for a block IR (no coords, only component types). Fallback to heuristic if needed."""
-        IR_PROMPT = (
-            "You are an educational storyboarder. Return ONLY JSON (no prose).\n"
-            "Schema: a JSON array of blocks. Block types:\n"
-            "  - {\"type\": \"title\", \"text\": str}\n"
-            "  - {\"type\": \"two_column\", \"left\": str, \"right\": str}\n"
-            "  - {\"type\": \"formula\", \"latex\": str, \"row_start\": int, \"row_end\": int}\n"
-            "Rules:\n- No coordinates, no .shift/.to_edge.\n- Keep text concise.\n- Prefer two_column with summary on left and key points or short formula on right.\n"
+        IR_PROMPT = self.BLOCKS_IR_PROMPT_HEADER + (
             f"TITLE: {tc.title}\nAUDIENCE: {audience}\nDURATION_MIN: {tc.estimated_duration}\n"
             f"OBJECTIVES: {json.dumps(tc.learning_objectives, ensure_ascii=False)}\n"
             f"KEY_CONCEPTS: {json.dumps(tc.key_concepts, ensure_ascii=False)}\n"
@@ -155,7 +288,7 @@ class ManimCodeGenerator:
         blocks: List[Dict[str, Any]] = []
         blocks.append({"type": "title", "text": tc.title})
         # Build one or two two_column blocks from objectives and summary
-        left = "; ".join([str(x) for x in (tc.learning_objectives or [])[:5]])
+        left = "; ".join(map(str, (tc.learning_objectives or [])[:5]))
         right = (tc.summary or "")[:300]
         if left or right:
             blocks.append({"type": "two_column", "left": left, "right": right})
@@ -168,8 +301,7 @@ class ManimCodeGenerator:
 
     def _render_blocks_code(self, blocks: List[Dict[str, Any]]) -> str:
         """Read renderer template and inject block list as Python literal."""
-        template_path = Path(__file__).resolve().parents[1] / 'src' / 'renderer_template.py'
-        src = template_path.read_text(encoding='utf-8')
+        src = _read_template('renderer_template.py')
         code = src.replace("__BLOCKS__", f"blocks = {json.dumps(blocks, ensure_ascii=False)}")
         return code
 
@@ -178,18 +310,7 @@ class ManimCodeGenerator:
     # ----------------------
     def _generate_slides_ir(self, tc: TeachingContent, audience: str) -> List[Dict[str, Any]]:
         """Ask the model for a slides IR. Fallback to a heuristic varied deck if needed."""
-        PROMPT = (
-            "Return ONLY JSON (no prose). Schema is a JSON array of slide dicts (no wrapper key).\n"
-            "Slide types: title/bullets/two_column/equation/plot/bar/figure.\n"
-            "Examples:\n"
-            "  {\"type\":\"title\",\"text\":str}\n"
-            "  {\"type\":\"bullets\",\"title\":str,\"items\":[str,...]}\n"
-            "  {\"type\":\"two_column\",\"left_title\":str,\"left\":str,\"right_title\":str,\"right\":str}\n"
-            "  {\"type\":\"equation\",\"title\":str,\"lines\":[latex,...]}\n"
-            "  {\"type\":\"plot\",\"title\":str,\"expr\":python_expr,\"x_range\":[min,max,step],\"y_range\":[min,max,step]}\n"
-            "  {\"type\":\"bar\",\"title\":str,\"labels\":[str],\"values\":[num]}\n"
-            "  {\"type\":\"figure\",\"title\":str,\"caption\":str}\n"
-            "Rules: keep text concise; no coordinates; ensure slides are varied and readable.\n"
+        PROMPT = self.SLIDES_IR_PROMPT_HEADER + (
             f"TITLE: {tc.title}\nAUDIENCE: {audience}\nDURATION_MIN: {tc.estimated_duration}\n"
             f"OBJECTIVES: {json.dumps(tc.learning_objectives, ensure_ascii=False)}\n"
             f"KEY_CONCEPTS: {json.dumps(tc.key_concepts, ensure_ascii=False)}\n"
@@ -237,7 +358,8 @@ class ManimCodeGenerator:
             slides.append({"type": "equation", "title": "Key Equations", "lines": [s for s in eq_lines if s]})
         # Heuristic visual slide based on content/topic (avoid random charts)
         topic = (tc.title + " " + tc.content_chunk.content[:400]).lower()
-        if any(k in topic for k in ["velocity", "acceleration", "kinematic", "motion"]):
+        found = {m.lastgroup for m in _TOPIC_VISUAL_RE.finditer(topic)}
+        if "motion" in found:
             slides.append({
                 "type": "plot",
                 "title": "Velocity vs. Time",
@@ -245,13 +367,13 @@ class ManimCodeGenerator:
                 "x_range": [0, 10, 0.1],
                 "y_range": [0, 50, 5]
             })
-        elif any(k in topic for k in ["work", "energy", "power"]):
+        elif "energy" in found:
             slides.append({
                 "type": "equation",
                 "title": "Work & Energy",
                 "lines": [r"W = \vec{F}\cdot\vec{d} = F d \cos\theta", r"E_k = \tfrac{1}{2} m v^2"]
             })
-        elif any(k in topic for k in ["force", "free-body", "newton"]):
+        elif "force" in found:
             slides.append({
                 "type": "figure",
                 "title": "Free-Body Diagram",
@@ -260,8 +382,7 @@ class ManimCodeGenerator:
         return slides
 
     def _render_slides_code(self, slides: List[Dict[str, Any]]) -> str:
-        template_path = Path(__file__).resolve().parents[1] / 'src' / 'adaptive_renderer.py'
-        src = template_path.read_text(encoding='utf-8')
+        src = _read_template('adaptive_renderer.py')
         return src.replace("__SLIDES__", json.dumps(slides, ensure_ascii=False))
 
     # ----------------------
@@ -288,26 +409,32 @@ class ManimCodeGenerator:
         slides: List[Dict[str, Any]] = []
 
         # Slide 1
-        bullets1 = [sanitize(x) for x in (tc.learning_objectives or [])][:5]
+        bullets1 = [sanitize(x) for x in (tc.learning_objectives or [])[:5]]
         formulas_all = [f.get('formula', '') if isinstance(f, dict) else str(f) for f in (tc.formulas or [])]
+        # Slides show at most the first non-empty formula; filter once, not per slide
+        lead_formula = [f for f in formulas_all if f][:1]
         slide1 = {
             "title": tc.title,
             "bullets": bullets1,
-            "formulas": [f for f in formulas_all if f][:1],
+            "formulas": list(lead_formula),
         }
         slides.append(slide1)
 
         # Key concepts slides
         for kc in (tc.key_concepts or [])[:4]:
-            concept = sanitize(kc.get('concept') if isinstance(kc, dict) else str(kc))
-            definition = sanitize(kc.get('definition') if isinstance(kc, dict) else "")
+            if isinstance(kc, dict):
+                concept = sanitize(kc.get('concept'))
+                definition = sanitize(kc.get('definition'))
+            else:
+                concept = sanitize(str(kc))
+                definition = ""
             if not concept:
                 continue
             b = [concept] + (sentences(definition)[:3] if definition else [])
             slides.append({
                 "title": concept,
                 "bullets": b[:5],
-                "formulas": [f for f in formulas_all if f][:1],
+                "formulas": list(lead_formula),
             })
 
         # Examples / Explanations slides
@@ -349,25 +476,7 @@ class ManimCodeGenerator:
         json_blob = json.dumps(blueprint, ensure_ascii=False)
         # Escape for safe embedding inside single-quoted Python string
         json_blob = json_blob.replace('\\', r'\\').replace("'", r"\'")
-        code = f"""
-from manim import *
-import json
-import sys
-from pathlib import Path
-
-# Ensure repo root is importable for src.* modules
-REPO_ROOT = Path(__file__).resolve().parents[2]
-if str(REPO_ROOT) not in sys.path:
-    sys.path.insert(0, str(REPO_ROOT))
-
-from src.structured_renderer import render_video
-
-BLUEPRINT = json.loads('{json_blob}')
-
-class Video(Scene):
-    def construct(self):
-        render_video(self, BLUEPRINT)
-"""
+        code = self.STRUCTURED_SCRIPT_TEMPLATE.replace("__BLUEPRINT_JSON__", json_blob)
         path = self.temp_dir / f"{output_name}.py"
         path.write_text(code, encoding='utf-8')
         return str(path)
@@ -381,11 +490,11 @@ class Video(Scene):
             return self._render_blocks_code(ir)
         objs = "\n".join(f"- {o}" for o in tc.learning_objectives)
         concepts = "\n".join(f"- {k.get('concept','')}: {k.get('definition','')}" for k in tc.key_concepts)
-        details = "\n".join((d.get('section','Section')+":\n"+d.get('explanation','')) for d in tc.detailed_explanations)
+        details = "\n".join(f"{d.get('section','Section')}:\n{d.get('explanation','')}" for d in tc.detailed_explanations)
         prompt = self.MANIM_CODE_PROMPT.format(
             title=tc.title, difficulty=tc.difficulty_level, audience=audience, duration=tc.estimated_duration,
             learning_objectives=objs, key_concepts=concepts, details=details, narration=tc.narration_script,
-            scene_plan=json.dumps(tc.to_dict().get('scenes', []), ensure_ascii=False)
+            scene_plan=json.dumps(tc.scenes, ensure_ascii=False)
         )
         resp = self.client.chat.completions.create(
             model=self.model,
@@ -396,25 +505,42 @@ class Video(Scene):
         return self._clean_generated_code(code)
 
     def _clean_generated_code(self, code: str) -> str:
-        code = re.sub(r"```python\s*\n|```$", "", code).strip()
+        code = code.strip()
+        if code.startswith("```"):
+            # Drop the whole opening fence line, whatever its language tag
+            # (```python, ```Python, ```py3, ...)
+            code = code.partition("\n")[2]
+        if code.endswith("```"):
+            code = code[:-3]
+        code = code.strip()
         if "from manim import *" not in code:
-            code = "from manim import *\n\n" + code
-        if "random.seed(" not in code and "np.random.seed(" not in code:
-            code = code.replace("from manim import *\n\n", "from manim import *\nimport random, numpy as np\nrandom.seed(42); np.random.seed(42)\n\n", 1)
+            code = self.MANIM_IMPORT_HEADER + code
+        if "random.seed(" not in code:  # also matches np.random.seed(
+            code = code.replace(self.MANIM_IMPORT_HEADER, self.SEEDED_IMPORT_HEADER, 1)
         return code
 
     def _compile_with_auto_debug(self, manim_code: str, output_name: str) -> VideoGenerationResult:
         result = VideoGenerationResult(success=False)
         current = manim_code
         code_path = self.temp_dir / f"{output_name}.py"
+        # Failed compilations keyed by code hash; fix loops can cycle back to an
+        # earlier version, and rerunning manim on it would fail the same way.
+        failed_by_hash: Dict[str, Dict[str, Any]] = {}
         for attempt in range(1, self.max_debug_attempts + 1):
             print(f"         ?? Compilation attempt {attempt}/{self.max_debug_attempts}")
             # Snapshot current code for this attempt
             snap_path = self.temp_dir / f"{output_name}_attempt_{attempt}.py"
             snap_path.write_text(current, encoding="utf-8")
-            # Compile using canonical filename (to keep output stable), but persist snapshot
-            code_path.write_text(current, encoding="utf-8")
-            comp = self._compile_manim_code(code_path, output_name)
+            code_hash = hashlib.sha1(current.encode("utf-8")).hexdigest()
+            comp = failed_by_hash.get(code_hash)
+            if comp is None:
+                # Compile using canonical filename (to keep output stable), but persist snapshot
+                code_path.write_text(current, encoding="utf-8")
+                comp = self._compile_manim_code(code_path, output_name, code=current)
+                if not comp['success']:
+                    failed_by_hash[code_hash] = comp
+            else:
+                print("         ?? Code identical to an earlier failed attempt; reusing its result")
             result.attempts_made = attempt
             result.compilation_logs.append(comp.get('log') or '')
             log_path = self._persist_log(output_name, attempt, comp.get('log') or '')
@@ -444,29 +570,27 @@ class Video(Scene):
         result.error_message = result.error_message or f"Maximum debug attempts ({self.max_debug_attempts}) exceeded"
         return result
 
-    def _compile_manim_code(self, code_path: Path, output_name: str) -> Dict[str, Any]:
+    def _compile_manim_code(self, code_path: Path, output_name: str, code: Optional[str] = None) -> Dict[str, Any]:
+        """Render code_path with manim; pass code when the caller already holds the file's text."""
         try:
             # Detect scene name
-            code = code_path.read_text(encoding="utf-8")
-            m = re.search(r"class\s+(\w+)\s*\(Scene\)", code)
-            scene_name = m.group(1) if m else "Scene"
-            # Call manim from temp_dir (use filename)
+            if code is None:
+                # errors="replace": a stray non-UTF-8 byte in generated code must not abort the render
+                code = code_path.read_text(encoding="utf-8", errors="replace")
+            scene_name = _detect_scene_name(code)
+            # Call manim from temp_dir (use filename). Each output gets its own
+            # media dir: manim's text/Tex caches are not safe to share between
+            # renders running side by side.
             cmd = [
                 'manim', code_path.name, scene_name,
                 '-q', self.manim_quality,
-                '-o', output_name, '--format', 'mp4', '--disable_caching'
+                '-o', output_name, '--format', 'mp4', '--disable_caching',
+                '--media_dir', str(self._media_dir(output_name)),
             ]
-            env = os.environ.copy()
-            # Ensure src/ is importable by the generated script
-            repo_root = Path(__file__).resolve().parents[1]
-            env['PYTHONPATH'] = (env.get('PYTHONPATH', '') + (os.pathsep if env.get('PYTHONPATH') else '') + str(repo_root))
-            proc = subprocess.run(cmd, cwd=str(self.temp_dir), capture_output=True, text=True, timeout=240, env=env)
+            proc = subprocess.run(cmd, cwd=str(self.temp_dir), capture_output=True, text=True, timeout=240, env=self.compile_env)
             video_path = None
             if proc.returncode == 0:
-                # locate produced mp4
-                cands = sorted(self.temp_dir.rglob(f"*{output_name}*.mp4"), key=lambda p: p.stat().st_mtime, reverse=True)
-                if cands:
-                    video_path = str(cands[0])
+                video_path = self._find_rendered_video(code_path, output_name)
             success = proc.returncode == 0 and bool(video_path)
             final_path = None
             if success:
@@ -489,6 +613,44 @@ class Video(Scene):
         except Exception as e:
             return {'success': False, 'video_path': None, 'error': str(e), 'log': str(e)}
 
+    def _media_dir(self, output_name: str) -> Path:
+        """manim --media_dir for output_name's renders."""
+        return (self.temp_dir / 'media' / output_name).resolve()
+
+    def _find_rendered_video(self, code_path: Path, output_name: str) -> Optional[str]:
+        """Locate the mp4 manim just wrote for output_name (newest if several)."""
+        # manim writes <media dir>/videos/<script stem>/<quality dir>/<output>.mp4;
+        # list just those quality dirs rather than walking every render.
+        target = f"{output_name}.mp4"
+        media_dir = self._media_dir(output_name)
+        videos_dir = media_dir / 'videos' / code_path.stem
+        quality_dir = _QUALITY_DIRS.get(self.manim_quality)
+        if quality_dir:
+            exact = os.path.join(videos_dir, quality_dir, target)
+            if os.path.isfile(exact):
+                return exact
+        newest, newest_mtime = None, -1.0
+        try:
+            with os.scandir(videos_dir) as entries:
+                for ent in entries:
+                    if not ent.is_dir():
+                        continue
+                    try:
+                        mtime = os.stat(os.path.join(ent.path, target)).st_mtime
+                    except OSError:
+                        continue
+                    if mtime > newest_mtime:
+                        newest, newest_mtime = os.path.join(ent.path, target), mtime
+        except OSError:
+            pass
+        if newest is not None:
+            return newest
+        # Unexpected layout (e.g. custom video_dir): fall back to a full search
+        # of this output's media dir. Only the newest match is needed; max()
+        # avoids sorting them all
+        found = max(media_dir.rglob(f"*{output_name}*.mp4"), key=lambda p: p.stat().st_mtime, default=None)
+        return str(found) if found is not None else None
+
     def _fix_code_with_openai(self, code: str, error_log: str) -> Optional[str]:
         try:
             prompt = self.ERROR_FIX_PROMPT.format(error_log=error_log[:8000], code=code)
@@ -507,58 +669,54 @@ class Video(Scene):
         # sanitize problematic LaTeX lines and common unicode
         fixed = self._sanitize_equation_lines_in_code(fixed)
         # common small fixes
-        fixes = [
-            (r"Text\(([^\)]*)size\s*=\s*\d+([^\)]*)\)", r"Text(\1\2)"),
-            (r"(Write|Create)\(([^\)]*),\s*run_time\s*=\s*[^\)]*\)", r"\1(\2)"),
-            (r"\.to_edge\(([^\)]*),\s*buff\s*=\s*[^\)]*\)", r".to_edge(\1)"),
-            (r"ShowCreation\(", r"Create("),
-            (r"ReplacementTransform\(", r"Transform("),
-            # Replace external assets with simple placeholders
-            (r"SVGMobject\([^\)]*\)", r"Text('diagram', font_size=36)"),
-            (r"ImageMobject\([^\)]*\)", r"Text('image', font_size=36)"),
-            # Defensive: ensure Scene subclass exists
-            (r"class\s+(\w+)\s*\((?:MovingCamera)?Scene\)\s*:\s*pass", r"class \1(Scene):\n    def construct(self):\n        self.add(Text('Placeholder', font_size=36))"),
-        ]
-        for pat, rep in fixes:
-            fixed = re.sub(pat, rep, fixed)
+        for pat, rep in _FALLBACK_FIXES:
+            fixed = pat.sub(rep, fixed)
         # sanitize embedded plot expr literals if present
         fixed = self._sanitize_plot_expr_literals(fixed)
         return fixed
 
     def _sanitize_plot_expr_literals(self, code: str) -> str:
         # Replace "expr": "..." values to safe forms: RHS only, caret to **, t->x, pi->np.pi
+        if '"expr"' not in code:
+            return code
         def repl(m: re.Match) -> str:
             content = m.group(1)
             s = content
             if '=' in s:
                 s = s.split('=')[-1]
             s = s.replace('^', '**')
-            s = re.sub(r"\bpi\b", "np.pi", s)
-            s = re.sub(r"\bt\b", "x", s)
+            s = _PI_RE.sub("np.pi", s)
+            s = _T_VAR_RE.sub("x", s)
             # keep quotes
             return f'"expr": "{s}"'
         try:
-            return re.sub(r"\"expr\"\s*:\s*\"([^\"]*)\"", repl, code)
+            return _PLOT_EXPR_RE.sub(repl, code)
         except Exception:
             return code
 
     def _sanitize_equation_lines_in_code(self, code: str) -> str:
         # Replace suspicious characters and fix common physics latex tokens
+        if '"lines"' not in code:
+            # No equation slides embedded; skip the DOTALL scan entirely
+            return code
         def clean_line(s: str) -> str:
             t = s
-            # fix half terms like weird chars → 1/2 a t^2
-            t = t.replace('½', r'\\tfrac{1}{2}')
-            t = t.replace('�at�', r'\\tfrac{1}{2} a t^{2}')
-            t = t.replace('�', '')
+            # Most LaTeX lines are plain ASCII; the unicode fixes below are no-ops then
+            non_ascii = not t.isascii()
+            if non_ascii:
+                # fix half terms like weird chars → 1/2 a t^2
+                t = t.replace('½', r'\\tfrac{1}{2}')
+                t = t.replace('�at�', r'\\tfrac{1}{2} a t^{2}')
+                t = t.replace('�', '')
             # subscripts
-            t = re.sub(r'\bv0\b', r'v_0', t)
-            t = re.sub(r'\bx0\b', r'x_0', t)
-            t = re.sub(r'\bt0\b', r't_0', t)
-            # minus variants
-            t = t.replace('–', '-')
-            t = t.replace('—', '-')
-            # strip other non-ascii chars
-            t = re.sub(r'[^\x00-\x7F]', '', t)
+            for pat, sub in _SUBSCRIPT_FIXES:
+                t = pat.sub(sub, t)
+            if non_ascii:
+                # minus variants
+                t = t.replace('–', '-')
+                t = t.replace('—', '-')
+                # strip other non-ascii chars
+                t = _NON_ASCII_RE.sub('', t)
             return t
 
         try:
@@ -570,39 +728,39 @@ class Video(Scene):
                 def repl_str(ms: re.Match) -> str:
                     content = ms.group(1)
                     return '"' + clean_line(content) + '"'
-                cleaned_inside = re.sub(r'"([^"\\]*)"', repl_str, inside)
+                cleaned_inside = _STRING_LITERAL_RE.sub(repl_str, inside)
                 return full.replace(inside, cleaned_inside)
 
-            pattern = r'"lines"\s*:\s*\[(.*?)\]'
-            return re.sub(pattern, repl_block, code, flags=re.DOTALL)
+            return _EQUATION_LINES_RE.sub(repl_block, code)
         except Exception:
             return code
 
     def _persist_log(self, output_name: str, attempt: int, log: str) -> str:
-        reports = self.output_dir.parent / 'reports'
-        reports.mkdir(parents=True, exist_ok=True)
-        p = reports / f"{output_name}_attempt_{attempt}.log"
+        p = self.reports_dir / f"{output_name}_attempt_{attempt}.log"
         p.write_text(log, encoding='utf-8')
         return str(p)
 
     def _persist_code_snapshot(self, output_name: str, attempt: int, code: str) -> str:
-        reports = self.output_dir.parent / 'reports'
-        reports.mkdir(parents=True, exist_ok=True)
-        p = reports / f"{output_name}_attempt_{attempt}.py"
+        p = self.reports_dir / f"{output_name}_attempt_{attempt}.py"
         p.write_text(code, encoding='utf-8')
         return str(p)
 
     def _persist_diff(self, output_name: str, attempt: int, before: str, after: str) -> tuple[str, int]:
-        reports = self.output_dir.parent / 'reports'
-        reports.mkdir(parents=True, exist_ok=True)
-        diff = list(difflib.unified_diff(
+        diff = difflib.unified_diff(
             before.splitlines(keepends=True),
             after.splitlines(keepends=True),
             fromfile=f"{output_name}_attempt_{attempt}_before.py",
             tofile=f"{output_name}_attempt_{attempt}_after.py",
             lineterm=''
-        ))
-        p = reports / f"{output_name}_attempt_{attempt}_fix.diff"
-        p.write_text('\n'.join(diff), encoding='utf-8')
-        changed = sum(1 for ln in diff if (ln.startswith('+') or ln.startswith('-')) and not ln.startswith('+++') and not ln.startswith('---'))
+        )
+        p = self.reports_dir / f"{output_name}_attempt_{attempt}_fix.diff"
+        # Stream the diff to disk and count changed lines in the same pass
+        changed = 0
+        with p.open('w', encoding='utf-8') as fh:
+            for i, ln in enumerate(diff):
+                if i:
+                    fh.write('\n')
+                fh.write(ln)
+                if ln.startswith(('+', '-')) and not ln.startswith(('+++', '---')):
+                    changed += 1
         return str(p), changed
@@ -0,0 +1,18 @@
+"""
+Shared OpenAI client factory.
+
+Every pipeline component talks to the same API with the same key, so they
+share one client (and its keep-alive connection pool) instead of each opening
+their own connections and paying a fresh TLS handshake.
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def get_openai_client(api_key: str):
+    """Return the process-wide OpenAI client for api_key, creating it once."""
+    # Imported lazily: openai pulls in httpx/pydantic, which callers that only
+    # need the pipeline dataclasses should not pay for.
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
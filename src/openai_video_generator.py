@@ -8,9 +8,10 @@ import re
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from pathlib import Path
-from openai import OpenAI
 
 from .intelligent_chunker import ContentChunk
+from .llm_json import extract_json_object
+from .openai_client import get_openai_client
 
 
 @dataclass
@@ -85,7 +86,7 @@ class OpenAIVideoGenerator:
     )
 
     def __init__(self, openai_api_key: str, model: str = "gpt-4o"):
-        self.client = OpenAI(api_key=openai_api_key)
+        self.client = get_openai_client(openai_api_key)
         self.model = model
 
     def generate_teaching_content(self, content_chunk: ContentChunk, audience: str = "undergraduate") -> Optional[TeachingContent]:
@@ -140,12 +141,7 @@ class OpenAIVideoGenerator:
         return tc
 
     def _extract_json(self, text: str) -> Optional[Dict[str, Any]]:
-        m = re.search(r"```json\s*(.*?)```", text, re.DOTALL)
-        j = m.group(1) if m else text[text.find("{") : text.rfind("}") + 1]
-        try:
-            return json.loads(j)
-        except Exception:
-            return None
+        return extract_json_object(text)
 
     def _ensure_detail(self, data: Optional[Dict[str, Any]], chunk: ContentChunk) -> Optional[Dict[str, Any]]:
         if not data:
@@ -9,6 +9,41 @@ from manim import *
 from src.components import PanelGrid, Title, TwoColumn, FormulaBlock, BulletList, CaptionUnder
 
 
+def _title_block(scene, grid, b):
+    obj = Title.build(scene, grid, b.get("text", ""))
+    scene.play(FadeIn(obj, shift=DOWN * 0.2))
+
+
+def _two_column_block(scene, grid, b):
+    l, r = TwoColumn.build(scene, grid, b.get("left", ""), b.get("right", ""))
+    scene.play(FadeIn(VGroup(l, r), lag_ratio=0.1))
+
+
+def _formula_block(scene, grid, b):
+    obj = FormulaBlock.build(scene, grid, b.get("latex", ""), b.get("row_start", 2), b.get("row_end", 3))
+    scene.play(FadeIn(obj))
+
+
+def _bullet_list_block(scene, grid, b):
+    obj = BulletList.build(scene, grid, b.get("bullets", []), b.get("side", "full"), b.get("row_start", 2), b.get("row_end", None), b.get("font_size", 34))
+    scene.play(FadeIn(obj))
+
+
+def _caption_block(scene, grid, b):
+    obj = CaptionUnder.build(scene, grid, b.get("text", ""))
+    scene.play(FadeIn(obj))
+
+
+# Block type -> build-and-show; unknown types are skipped
+BLOCK_BUILDERS = {
+    "title": _title_block,
+    "two_column": _two_column_block,
+    "formula": _formula_block,
+    "bullet_list": _bullet_list_block,
+    "caption": _caption_block,
+}
+
+
 class Lesson(Scene):
     def construct(self):
         grid = PanelGrid(self, rows=8, cols=12, margin=0.6)
@@ -18,22 +53,9 @@ class Lesson(Scene):
 
         # Basic fade-in progression
         for b in blocks:
-            t = b.get("type")
-            if t == "title":
-                obj = Title.build(self, grid, b.get("text", ""))
-                self.play(FadeIn(obj, shift=DOWN * 0.2))
-            elif t == "two_column":
-                l, r = TwoColumn.build(self, grid, b.get("left", ""), b.get("right", ""))
-                self.play(FadeIn(VGroup(l, r), lag_ratio=0.1))
-            elif t == "formula":
-                obj = FormulaBlock.build(self, grid, b.get("latex", ""), b.get("row_start", 2), b.get("row_end", 3))
-                self.play(FadeIn(obj))
-            elif t == "bullet_list":
-                obj = BulletList.build(self, grid, b.get("bullets", []), b.get("side", "full"), b.get("row_start", 2), b.get("row_end", None), b.get("font_size", 34))
-                self.play(FadeIn(obj))
-            elif t == "caption":
-                obj = CaptionUnder.build(self, grid, b.get("text", ""))
-                self.play(FadeIn(obj))
+            show = BLOCK_BUILDERS.get(b.get("type"))
+            if show is not None:
+                show(self, grid, b)
             self.wait(0.4)
 
         self.wait(1.0)
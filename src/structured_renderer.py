@@ -36,25 +36,24 @@ def _wrap_into_lines(text: str, max_width: float, font_size: int) -> List[str]:
     if not words:
         return []
     lines: List[str] = []
-    cur: List[str] = []
+    # Current line kept as a string so each trial is one concatenation
+    # rather than a re-join of every word on the line.
+    cur = ""
     for w in words:
-        trial = (" ".join(cur + [w])).strip()
-        if not trial:
-            cur.append(w)
-            continue
+        trial = f"{cur} {w}" if cur else w
         m = Text(trial, font_size=font_size)
         if m.width <= max_width:
-            cur.append(w)
+            cur = trial
         else:
             if cur:
-                lines.append(" ".join(cur))
-                cur = [w]
+                lines.append(cur)
+                cur = w
             else:
                 # Single very long word; accept it and let scaling handle later
                 lines.append(w)
-                cur = []
+                cur = ""
     if cur:
-        lines.append(" ".join(cur))
+        lines.append(cur)
     return lines
 
 
@@ -62,14 +62,17 @@ class UnifiedBookProcessor:
                     data = json.loads(p.read_text(encoding="utf-8"))
                     content = data.get("content") or data.get("text") or ""
                     title = data.get("title") or p.stem.replace("_", " ")
-                    sections = [BookSection(title=title, content=content)]
-                    return BookContent(title=title, content=content, format="json", filepath=str(p), sections=sections, metadata=data)
+                    # Single section spans the whole book: count words once for both
+                    word_count = len(content.split())
+                    sections = [BookSection(title=title, content=content, word_count=word_count)]
+                    return BookContent(title=title, content=content, format="json", filepath=str(p), sections=sections, metadata=data, word_count=word_count)
                 else:
                     content = p.read_text(encoding="utf-8")
                     title = self._infer_title(content, p.stem)
-                    sections = [BookSection(title=title, content=content)]
+                    word_count = len(content.split())
+                    sections = [BookSection(title=title, content=content, word_count=word_count)]
                     fmt = "markdown" if p.suffix.lower() == ".md" else "text"
-                    return BookContent(title=title, content=content, format=fmt, filepath=str(p), sections=sections, metadata={"source": fmt})
+                    return BookContent(title=title, content=content, format=fmt, filepath=str(p), sections=sections, metadata={"source": fmt}, word_count=word_count)
         return None
 
     def _infer_title(self, content: str, fallback: str) -> str:
@@ -0,0 +1,68 @@
+"""Fast unit tests for IntelligentChunker's text helpers (no LLM)."""
+
+import pytest
+
+import src.intelligent_chunker as chunker_mod
+from src.intelligent_chunker import IntelligentChunker
+from src.llm_json import extract_json_object
+
+
+@pytest.fixture
+def chunker(monkeypatch):
+    monkeypatch.setattr(chunker_mod, "get_openai_client", lambda key: None)
+    return IntelligentChunker("test-key")
+
+
+# ---------- JSON extraction ----------
+
+def test_extract_json_fenced():
+    assert extract_json_object('Plan:\n```json\n{"chunks": []}\n```') == {"chunks": []}
+
+
+def test_extract_json_bare_braces():
+    assert extract_json_object('Sure! {"a": {"b": 1}} Done.') == {"a": {"b": 1}}
+
+
+@pytest.mark.parametrize("text", ["I cannot help with that.", "} before {", '{"a": '])
+def test_extract_json_none(text):
+    assert extract_json_object(text) is None
+
+
+# ---------- analysis truncation ----------
+
+def test_prepare_content_short_is_unchanged(chunker):
+    text = "Short text."
+    assert chunker._prepare_content_for_analysis(text, max_chars=100) is text
+
+
+def test_prepare_content_cuts_at_tail_paragraph(chunker):
+    text = "a" * 85 + "\n\n" + "b" * 100
+    out = chunker._prepare_content_for_analysis(text, max_chars=100)
+    assert out == "a" * 85 + f"\n\n[CONTENT TRUNCATED - total {len(text)} chars]"
+
+
+def test_prepare_content_cuts_after_tail_sentence(chunker):
+    text = "a" * 94 + "." + "b" * 100
+    out = chunker._prepare_content_for_analysis(text, max_chars=100)
+    assert out.startswith("a" * 94 + ".\n\n[CONTENT TRUNCATED")
+
+
+def test_prepare_content_ignores_early_boundaries(chunker):
+    # Boundaries outside the tail window are not used as cut points
+    text = "a" * 10 + "\n\n" + "b" * 10 + "." + "c" * 200
+    out = chunker._prepare_content_for_analysis(text, max_chars=100)
+    assert out.startswith(text[:100] + "\n\n[CONTENT TRUNCATED")
+
+
+# ---------- marker matching ----------
+
+def test_clean_marker_normalizes_ellipses_and_spaces(chunker):
+    assert chunker._clean_marker("  the   rate…of change... ") == "the rate of change"
+
+
+def test_fuzzy_find_exact_and_whitespace_insensitive(chunker):
+    text = "Intro.\nThe derivative\n   measures  change."
+    assert chunker._fuzzy_find(text, "The derivative") == text.find("The derivative")
+    # Found in the whitespace-collapsed text
+    assert chunker._fuzzy_find(text, "derivative measures change") != -1
+    assert chunker._fuzzy_find(text, "integral") == -1
@@ -0,0 +1,108 @@
+"""Fast unit tests for ManimCodeGenerator's pure helpers (no LLM, no manim)."""
+
+from types import SimpleNamespace
+
+import pytest
+
+import src.manim_code_generator as mcg
+from src.manim_code_generator import ManimCodeGenerator, _detect_scene_name
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    # No API calls are made; keep the OpenAI client out of unit tests
+    monkeypatch.setattr(mcg, "get_openai_client", lambda key: None)
+    return ManimCodeGenerator(
+        "test-key",
+        output_dir=str(tmp_path / "output" / "videos"),
+        temp_dir=str(tmp_path / "temp"),
+    )
+
+
+# ---------- scene name detection ----------
+
+def test_detect_scene_name_plain_scene():
+    assert _detect_scene_name("from manim import *\n\nclass Lesson(Scene):\n    pass\n") == "Lesson"
+
+
+def test_detect_scene_name_other_scene_bases():
+    assert _detect_scene_name("class Orbit(ThreeDScene):\n    pass\n") == "Orbit"
+    assert _detect_scene_name("import manim\nclass Zoom(manim.MovingCameraScene):\n    pass\n") == "Zoom"
+
+
+def test_detect_scene_name_multiline_header():
+    code = "class Helper:\n    pass\n\nclass Lesson(\n    Scene,\n):\n    pass\n"
+    assert _detect_scene_name(code) == "Lesson"
+
+
+def test_detect_scene_name_defaults():
+    assert _detect_scene_name("class Helper:\n    pass\n") == "Scene"
+    assert _detect_scene_name("def broken(:\n") == "Scene"
+
+
+# ---------- fence stripping ----------
+
+@pytest.mark.parametrize("fence", ["```python", "```Python", "```python3", "```py", "```py3", "```"])
+def test_clean_generated_code_strips_any_fence_tag(generator, fence):
+    reply = f"{fence}\nfrom manim import *\n\nclass Lesson(Scene):\n    pass\n```"
+    code = generator._clean_generated_code(reply)
+    assert code.startswith("from manim import *")
+    assert code.rstrip().endswith("pass")
+
+
+def test_clean_generated_code_adds_seeded_header(generator):
+    code = generator._clean_generated_code("class Lesson(Scene):\n    pass")
+    assert code.startswith(ManimCodeGenerator.SEEDED_IMPORT_HEADER)
+
+
+def test_clean_generated_code_keeps_existing_seed(generator):
+    body = "from manim import *\nimport numpy as np\nnp.random.seed(1)\n"
+    assert generator._clean_generated_code(body) == body.strip()
+
+
+# ---------- auto-debug loop ----------
+
+def test_auto_debug_reuses_result_for_repeated_code(generator):
+    compiled = []
+
+    def fake_compile(code_path, output_name, code=None):
+        compiled.append(code)
+        return {"success": False, "video_path": None, "error": "boom", "log": "boom"}
+
+    # The "fix" flips between two versions, as model repair loops can
+    generator._compile_manim_code = fake_compile
+    generator._fix_code_with_openai = lambda code, log: "B" if code == "A" else "A"
+
+    result = generator._compile_with_auto_debug("A", "lesson")
+
+    assert not result.success
+    assert result.attempts_made == generator.max_debug_attempts
+    assert compiled == ["A", "B"]
+
+
+# ---------- fallback deck ----------
+
+def _teaching_content(title, text=""):
+    return SimpleNamespace(
+        title=title,
+        learning_objectives=[],
+        key_concepts=[],
+        formulas=[],
+        summary="",
+        content_chunk=SimpleNamespace(content=text),
+    )
+
+
+@pytest.mark.parametrize("title, slide_type", [
+    ("Force and Motion", "plot"),  # motion wins over force
+    ("Power in a network", "equation"),  # plain substring match, as before
+    ("Newton's laws", "figure"),
+])
+def test_slides_fallback_picks_visual_by_topic(generator, title, slide_type):
+    slides = generator._slides_ir_fallback(_teaching_content(title))
+    assert slides[-1]["type"] == slide_type
+
+
+def test_slides_fallback_without_topic_match(generator):
+    slides = generator._slides_ir_fallback(_teaching_content("Set theory"))
+    assert [s["type"] for s in slides] == ["title"]
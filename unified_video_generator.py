@@ -20,6 +20,9 @@ Usage Examples:
     # Generate with custom audience 
     python unified_video_generator.py --book "physics" --audience "high_school"
     
+    # Plan and render several chunks at once
+    python unified_video_generator.py --book "physics" --workers 4
+    
     # Interactive mode for book exploration
     python unified_video_generator.py --interactive
     
@@ -31,12 +34,17 @@ import os
 import sys
 import argparse
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
+# Audience levels offered by the interactive menu and --audience
+AUDIENCES = ("elementary", "high_school", "undergraduate", "graduate")
+
 def setup_environment():
     """Setup environment and validate requirements"""
     print("🚀 UNIFIED VIDEO GENERATOR - OpenAI Pipeline")
@@ -158,14 +166,13 @@ def interactive_mode(openai_key: str):
                         
                         # Get audience preference
                         print(f"\n🎯 Target audiences:")
-                        audiences = ["elementary", "high_school", "undergraduate", "graduate"]
-                        for i, audience in enumerate(audiences, 1):
+                        for i, audience in enumerate(AUDIENCES, 1):
                             print(f"   {i}. {audience}")
                         
-                        audience_choice = input(f"\nEnter audience (1-{len(audiences)}) [3]: ").strip()
+                        audience_choice = input(f"\nEnter audience (1-{len(AUDIENCES)}) [3]: ").strip()
                         if audience_choice:
                             audience_index = int(audience_choice) - 1
-                            audience = audiences[audience_index] if 0 <= audience_index < len(audiences) else "undergraduate"
+                            audience = AUDIENCES[audience_index] if 0 <= audience_index < len(AUDIENCES) else "undergraduate"
                         else:
                             audience = "undergraduate"
                         
@@ -213,7 +220,27 @@ def interactive_mode(openai_key: str):
         except Exception as e:
             print(f"❌ Error: {e}")
 
-def generate_book_video(openai_key: str, book_name: str, audience: str = "undergraduate") -> bool:
+@lru_cache(maxsize=None)
+def get_pipeline_components(openai_key: str):
+    """
+    Build the pipeline components once per API key and reuse them.
+
+    None of the components keep per-book state, so interactive sessions that
+    generate several videos share the same clients instead of rebuilding them.
+    """
+    from src.unified_book_processor import UnifiedBookProcessor
+    from src.intelligent_chunker import IntelligentChunker
+    from src.openai_video_generator import OpenAIVideoGenerator
+    from src.manim_code_generator import ManimCodeGenerator
+
+    return (
+        UnifiedBookProcessor(),
+        IntelligentChunker(openai_key),
+        OpenAIVideoGenerator(openai_key),
+        ManimCodeGenerator(openai_key),
+    )
+
+def generate_book_video(openai_key: str, book_name: str, audience: str = "undergraduate", workers: int = 1) -> bool:
     """
     Generate video for a book using the unified OpenAI pipeline
     
@@ -221,6 +248,7 @@ def generate_book_video(openai_key: str, book_name: str, audience: str = "underg
         openai_key: OpenAI API key
         book_name: Name of the book (without .txt extension)  
         audience: Target audience level
+        workers: Number of chunks processed concurrently (1 = sequential)
         
     Returns:
         True if successful, False otherwise
@@ -229,19 +257,10 @@ def generate_book_video(openai_key: str, book_name: str, audience: str = "underg
         print(f"\n📚 PROCESSING BOOK: {book_name}")
         print("=" * 50)
         
-        # Import unified components (will be created next)
-        from src.unified_book_processor import UnifiedBookProcessor
-        from src.intelligent_chunker import IntelligentChunker  
-        from src.openai_video_generator import OpenAIVideoGenerator
-        from src.manim_code_generator import ManimCodeGenerator
-        
         # Initialize components
         print("🔧 Initializing unified pipeline...")
         
-        book_processor = UnifiedBookProcessor()
-        chunker = IntelligentChunker(openai_key)
-        video_generator = OpenAIVideoGenerator(openai_key)
-        code_generator = ManimCodeGenerator(openai_key)
+        book_processor, chunker, video_generator, code_generator = get_pipeline_components(openai_key)
         
         # Phase 1: Load and process book
         print(f"\n📖 PHASE 1: Loading book '{book_name}'...")
@@ -267,13 +286,20 @@ def generate_book_video(openai_key: str, book_name: str, audience: str = "underg
         print(f"\n🎓 PHASE 3: Generating comprehensive teaching content...")
         teaching_contents = []
         
-        for i, chunk in enumerate(chunks, 1):
+        def build_teaching_content(indexed_chunk):
+            i, chunk = indexed_chunk
             print(f"   Processing chunk {i}/{len(chunks)}: {chunk.title}")
-            
-            teaching_content = video_generator.generate_teaching_content(
-                chunk, audience=audience
-            )
-            
+            return video_generator.generate_teaching_content(chunk, audience=audience)
+        
+        # Chunks are independent LLM round-trips; with workers > 1 their network
+        # latency overlaps. map() keeps results in chunk order either way.
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(build_teaching_content, enumerate(chunks, 1)))
+        else:
+            results = map(build_teaching_content, enumerate(chunks, 1))
+        
+        for i, teaching_content in enumerate(results, 1):
             if teaching_content:
                 teaching_contents.append(teaching_content)
                 print(f"   ✅ Teaching content generated for chunk {i}")
@@ -290,15 +316,25 @@ def generate_book_video(openai_key: str, book_name: str, audience: str = "underg
         print(f"\n🎬 PHASE 4: Generating Manim videos...")
         generated_videos = []
         
-        for i, teaching_content in enumerate(teaching_contents, 1):
+        def render_video(indexed_content):
+            i, teaching_content = indexed_content
             print(f"   Generating video {i}/{len(teaching_contents)}...")
-            
-            video_path = code_generator.generate_video(
+            return code_generator.generate_video(
                 teaching_content, 
                 audience=audience,
                 output_name=f"{book_name}_part_{i:02d}"
             )
-            
+        
+        # Each video renders in its own manim subprocess with its own output
+        # name and media dir (no shared text/Tex caches), so several can run
+        # side by side.
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                video_paths = list(pool.map(render_video, enumerate(teaching_contents, 1)))
+        else:
+            video_paths = map(render_video, enumerate(teaching_contents, 1))
+        
+        for i, video_path in enumerate(video_paths, 1):
             if video_path:
                 generated_videos.append(video_path)
                 print(f"   ✅ Video {i} generated: {Path(video_path).name}")
@@ -345,9 +381,12 @@ def main():
     
     # Generation options  
     parser.add_argument("--audience", type=str, default="undergraduate",
-                       choices=["elementary", "high_school", "undergraduate", "graduate"],
+                       choices=AUDIENCES,
                        help="Target audience level (default: undergraduate)")
     
+    parser.add_argument("--workers", type=int, default=1,
+                       help="Chunks planned and rendered concurrently (default: 1)")
+    
     # Interface options
     parser.add_argument("--interactive", "-i", action="store_true",
                        help="Run in interactive mode")
@@ -385,7 +424,7 @@ def main():
     
     # Direct book processing
     if args.book:
-        success = generate_book_video(openai_key, args.book, args.audience)
+        success = generate_book_video(openai_key, args.book, args.audience, workers=max(1, args.workers))
         if not success:
             sys.exit(1)
         return